@@ -164,6 +164,13 @@ impl IPFFile {
         &self.file_table
     }
 
+    /// Finds the first entry whose file name, without its directory, is `file_name`.
+    pub fn find_file(&self, file_name: &str) -> Option<&IPFFileTable> {
+        self.file_table
+            .iter()
+            .find(|entry| entry.file_name_bytes() == file_name.as_bytes())
+    }
+
     pub fn test() -> io::Result<()> {
         // Open the file and create a buffered reader
         let file = File::open("/home/ridwan/Documents/TreeOfSaviorCN/data/xml_client.ipf")?;
@@ -194,10 +201,21 @@ impl IPFFile {
 
 impl IPFFileTable {
     pub fn extract<R: Read + Seek>(&self, reader: &mut BinaryReader<R>) -> io::Result<Vec<u8>> {
-        reader.seek(SeekFrom::Start(self.file_pointer as u64))?;
+        let encrypted_data = self.read_compressed(reader)?;
+        self.unpack(encrypted_data)
+    }
 
-        let mut encrypted_data = reader.read_bytes(self.file_size_compressed as usize)?;
+    /// Reads the entry's bytes as stored in the archive, still encrypted and compressed.
+    pub fn read_compressed<R: Read + Seek>(
+        &self,
+        reader: &mut BinaryReader<R>,
+    ) -> io::Result<Vec<u8>> {
+        reader.seek(SeekFrom::Start(self.file_pointer as u64))?;
+        reader.read_bytes(self.file_size_compressed as usize)
+    }
 
+    /// Decrypts and decompresses bytes returned by `read_compressed`.
+    pub fn unpack(&self, mut encrypted_data: Vec<u8>) -> io::Result<Vec<u8>> {
         self.decrypt(&mut encrypted_data);
         let decompressed_data = self.decompress(&encrypted_data)?;
 
@@ -299,6 +317,18 @@ impl IPFFileTable {
     pub fn directory_name(&self) -> String {
         String::from_utf8_lossy(&self.directory_name).to_string()
     }
+
+    /// Last path component of the directory name, borrowed without decoding.
+    /// Like `Path::file_name`, trailing separators are ignored; both `/` and `\`
+    /// separate components, matching how the previous lookup behaved on Windows.
+    pub fn file_name_bytes(&self) -> &[u8] {
+        let is_separator = |b: &u8| *b == b'/' || *b == b'\\';
+        let trimmed = match self.directory_name.iter().rposition(|b| !is_separator(b)) {
+            Some(last) => &self.directory_name[..=last],
+            None => return &[],
+        };
+        trimmed.rsplit(is_separator).next().unwrap_or(trimmed)
+    }
 }
 
 impl IPFFooter {
@@ -332,3 +362,49 @@ impl IPFFooter {
         self.new_version
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn entry(directory_name: &str) -> IPFFileTable {
+        IPFFileTable {
+            directory_name: directory_name.as_bytes().to_vec(),
+            ..Default::default()
+        }
+    }
+
+    #[test]
+    fn file_name_bytes_takes_last_component() {
+        assert_eq!(
+            entry("char_hi/model/barrack_model.xac").file_name_bytes(),
+            b"barrack_model.xac"
+        );
+        assert_eq!(
+            entry("barrack_model.xac").file_name_bytes(),
+            b"barrack_model.xac"
+        );
+        assert_eq!(
+            entry("char_hi\\model\\barrack_model.xac").file_name_bytes(),
+            b"barrack_model.xac"
+        );
+        assert_eq!(entry("char_hi/model/").file_name_bytes(), b"model");
+        assert_eq!(entry("/").file_name_bytes(), b"");
+    }
+
+    #[test]
+    fn find_file_matches_whole_file_name() {
+        let ipf = IPFFile {
+            footer: IPFFooter::default(),
+            file_table: vec![
+                entry("char_hi/model/other_barrack_model.xac"),
+                entry("char_hi/model/barrack_model.xac"),
+            ],
+        };
+
+        let found = ipf.find_file("barrack_model.xac").unwrap();
+        assert_eq!(found.directory_name(), "char_hi/model/barrack_model.xac");
+        assert!(ipf.find_file("model").is_none());
+        assert!(ipf.find_file("missing.xac").is_none());
+    }
+}
@@ -1,5 +1,12 @@
-use crate::xac::Mesh;
+use crate::ipf::IPFFile;
+use crate::tosreader::BinaryReader;
+use crate::xac::{Mesh, PyMesh};
+use pyo3::exceptions::{PyDeprecationWarning, PyOSError};
 use pyo3::prelude::*;
+use pyo3::types::PyDict;
+use std::fs::File;
+use std::io::BufReader;
+use std::sync::{Mutex, PoisonError};
 use xac::SubMesh;
 
 pub fn add(left: u64, right: u64) -> u64 {
@@ -13,16 +20,108 @@ pub mod xac;
 
 // Python bindings function
 #[pyfunction]
-fn extract_xac_data_py(ipf_path: String, xac_filename: String) -> PyResult<Vec<Mesh>> {
-    match xac::extract_xac_data(&ipf_path, &xac_filename) {
+fn extract_xac_data_py(
+    py: Python<'_>,
+    ipf_path: String,
+    xac_filename: String,
+) -> PyResult<Vec<PyMesh>> {
+    PyErr::warn(
+        py,
+        py.get_type::<PyDeprecationWarning>().as_any(),
+        c"extract_xac_data_py re-reads the IPF file table on every call; use IpfArchive(ipf_path).extract_xac(xac_filename)",
+        1,
+    )?;
+
+    // Parsing is pure Rust, so other Python threads may run meanwhile
+    match py.allow_threads(|| xac::extract_xac_data(&ipf_path, &xac_filename)) {
         Ok(meshes) => {
-            // Convert Rust Vec<Mesh> to Python list
-            let py_meshes: Vec<Mesh> = meshes.into_iter().collect();
-            Ok(py_meshes)
+            // Convert Rust Vec<Mesh> to Python list, moving the submesh data across
+            meshes
+                .into_iter()
+                .map(|mesh| PyMesh::from_mesh(py, mesh))
+                .collect()
         }
-        Err(err) => Err(PyErr::new::<pyo3::exceptions::PyOSError, _>(
-            err.to_string(),
-        )),
+        Err(err) => Err(PyErr::new::<PyOSError, _>(err.to_string())),
+    }
+}
+
+// Extract every submesh of an xac as flat per-attribute lists in a single call
+#[pyfunction]
+fn extract_xac_flat<'py>(
+    py: Python<'py>,
+    ipf_path: String,
+    xac_filename: String,
+) -> PyResult<Bound<'py, PyDict>> {
+    PyErr::warn(
+        py,
+        py.get_type::<PyDeprecationWarning>().as_any(),
+        c"extract_xac_flat re-reads the IPF file table on every call; use IpfArchive(ipf_path).extract_xac_flat(xac_filename)",
+        1,
+    )?;
+
+    let meshes = py
+        .allow_threads(|| xac::extract_xac_data(&ipf_path, &xac_filename))
+        .map_err(|err| PyErr::new::<PyOSError, _>(err.to_string()))?;
+    xac::meshes_to_flat_dict(py, &meshes)
+}
+
+// An opened IPF archive whose file table is parsed once and shared by every extraction
+#[pyclass]
+struct IpfArchive {
+    ipf: IPFFile,
+    reader: Mutex<BinaryReader<BufReader<File>>>,
+}
+
+#[pymethods]
+impl IpfArchive {
+    #[new]
+    fn new(ipf_path: String) -> PyResult<Self> {
+        let open = || -> std::io::Result<Self> {
+            let file = File::open(&ipf_path)?;
+            let mut reader = BinaryReader::new(BufReader::new(file));
+            let ipf = IPFFile::load_from_reader(&mut reader)?;
+            Ok(IpfArchive {
+                ipf,
+                reader: Mutex::new(reader),
+            })
+        };
+        open().map_err(|err| PyErr::new::<PyOSError, _>(err.to_string()))
+    }
+
+    fn extract_xac(&self, py: Python<'_>, xac_filename: String) -> PyResult<Vec<PyMesh>> {
+        self.read_meshes(py, &xac_filename)?
+            .into_iter()
+            .map(|mesh| PyMesh::from_mesh(py, mesh))
+            .collect()
+    }
+
+    fn extract_xac_flat<'py>(
+        &self,
+        py: Python<'py>,
+        xac_filename: String,
+    ) -> PyResult<Bound<'py, PyDict>> {
+        let meshes = self.read_meshes(py, &xac_filename)?;
+        xac::meshes_to_flat_dict(py, &meshes)
+    }
+}
+
+impl IpfArchive {
+    fn read_meshes(&self, py: Python<'_>, xac_filename: &str) -> PyResult<Vec<Mesh>> {
+        py.allow_threads(|| -> std::io::Result<Vec<Mesh>> {
+            let Some(file_entry) = self.ipf.find_file(xac_filename) else {
+                return Ok(Vec::new());
+            };
+
+            // Only the read needs the shared reader; decoding and parsing run unlocked.
+            // Every read seeks to its own entry, so a poisoned reader is still usable.
+            let compressed = {
+                let mut reader = self.reader.lock().unwrap_or_else(PoisonError::into_inner);
+                file_entry.read_compressed(&mut reader)?
+            };
+            let data = file_entry.unpack(compressed)?;
+            xac::extract_xac_from_bytes(&data)
+        })
+        .map_err(|err| PyErr::new::<PyOSError, _>(err.to_string()))
     }
 }
 
@@ -30,8 +129,10 @@ fn extract_xac_data_py(ipf_path: String, xac_filename: String) -> PyResult<Vec<M
 #[pymodule]
 fn toslib(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<SubMesh>()?;
-    m.add_class::<Mesh>()?;
+    m.add_class::<PyMesh>()?;
+    m.add_class::<IpfArchive>()?;
     m.add_function(wrap_pyfunction!(extract_xac_data_py, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_xac_flat, m)?)?;
     Ok(())
 }
 
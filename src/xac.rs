@@ -2,8 +2,16 @@
 use crate::ipf::IPFFile;
 use crate::tosreader::BinaryReader;
 use binrw::{BinRead, binread};
+use bytes::Bytes;
+use numpy::ndarray::{ArrayView1, ArrayView2};
+use numpy::{PyArray1, PyArray2, PyArrayMethods};
+use pyo3::exceptions::{PyIndexError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{IntoPyDict, PyDict, PyString};
+use pyo3_bytes::PyBytes;
 use serde::{Deserialize, Serialize};
+use std::fmt;
 use std::fs::File;
 use std::io::{self, BufReader, BufWriter, Cursor, Read, Seek, SeekFrom, Write};
 use std::path::Path;
@@ -710,8 +718,9 @@ struct XACVertexAttributeLayer {
     is_scale: u8,
     padding: [u8; 2],
 
-    #[br(count = attrib_size_in_bytes * total_verts )]
-    mesh_data: Vec<u8>,
+    // Kept as reference-counted bytes so verbatim layers can be handed to Python as slices
+    #[br(count = attrib_size_in_bytes * total_verts, map = |data: Vec<u8>| Bytes::from(data))]
+    mesh_data: Bytes,
 }
 
 #[binread]
@@ -1105,8 +1114,114 @@ pub struct XACFile {
     chunk_data: Vec<XacChunkData>,
 }
 
+/// Copies `rows` into a single contiguous `(len, N)` float32 NumPy array.
+fn rows_to_pyarray<'py, const N: usize>(
+    py: Python<'py>,
+    rows: &[[f32; N]],
+) -> PyResult<Bound<'py, PyArray2<f32>>> {
+    PyArray1::from_slice(py, rows.as_flattened()).reshape([rows.len(), N])
+}
+
+/// Clears the `WRITEABLE` flag so a view over Rust-owned data cannot be edited in place.
+fn set_readonly(array: &Bound<'_, PyAny>) -> PyResult<()> {
+    let kwargs = [("write", false)].into_py_dict(array.py())?;
+    array.call_method("setflags", (), Some(&kwargs))?;
+    Ok(())
+}
+
+/// Zero-copy, read-only `(len, N)` float32 view of `rows`, which must belong to `owner`.
+fn rows_view<'py, const N: usize>(
+    owner: &Bound<'py, SubMesh>,
+    rows: &[[f32; N]],
+) -> PyResult<Bound<'py, PyArray2<f32>>> {
+    let view = ArrayView2::from_shape((rows.len(), N), rows.as_flattened())
+        .map_err(|err| PyErr::new::<PyValueError, _>(err.to_string()))?;
+    // SAFETY: SubMesh is a frozen pyclass, so `rows` is never mutated or freed while
+    // `owner`, which the array keeps alive as its base object, exists.
+    let array = unsafe { PyArray2::borrow_from_array(&view, owner.clone().into_any()) };
+    set_readonly(array.as_any())?;
+    Ok(array)
+}
+
+/// Zero-copy, read-only view of `values`, which must belong to `owner`.
+fn values_view<'py>(
+    owner: &Bound<'py, SubMesh>,
+    values: &[u32],
+) -> PyResult<Bound<'py, PyArray1<u32>>> {
+    let view = ArrayView1::from(values);
+    // SAFETY: as in `rows_view`, the frozen owner keeps `values` alive and unchanged.
+    let array = unsafe { PyArray1::borrow_from_array(&view, owner.clone().into_any()) };
+    set_readonly(array.as_any())?;
+    Ok(array)
+}
+
+/// Little-endian encoding of `values`, the layout `np.frombuffer(buf, "<f4")` expects.
+fn f32_le_bytes(values: &[f32]) -> Bytes {
+    let mut encoded = Vec::with_capacity(values.len() * 4);
+    for value in values {
+        encoded.extend_from_slice(&value.to_le_bytes());
+    }
+    encoded.into()
+}
+
+/// Slice of a vertex attribute layer covering one submesh, sharing the layer's buffer.
+fn layer_slice(data: &Bytes, vertex_offset: u32, num_verts: u32, stride: usize) -> Bytes {
+    let start = vertex_offset as usize * stride;
+    data.slice(start..start + num_verts as usize * stride)
+}
+
+/// The submesh's slice of a verbatim layer, or `values` encoded when there is none.
+fn raw_or_encoded(raw: &Option<Bytes>, values: &[f32]) -> PyBytes {
+    PyBytes::new(raw.clone().unwrap_or_else(|| f32_le_bytes(values)))
+}
+
+/// `(len, N)` float32 array read in place from a verbatim layer slice, falling back
+/// to a copy of `rows` when the submesh has no such slice.
+fn layer_array<'py, const N: usize>(
+    py: Python<'py>,
+    raw: &Option<Bytes>,
+    rows: &[[f32; N]],
+) -> PyResult<Bound<'py, PyAny>> {
+    match raw {
+        Some(data) => py
+            .import("numpy")?
+            .call_method1("frombuffer", (PyBytes::new(data.clone()), "<f4"))?
+            .call_method1("reshape", ((-1i64, N as i64),)),
+        None => Ok(rows_to_pyarray(py, rows)?.into_any()),
+    }
+}
+
+// Slices of the decoded XAC layers for the attributes that export_to_struct stores
+// exactly as they appear in the file, so they can reach Python without encoding.
+#[derive(Default, Debug, Clone)]
+struct RawLayers {
+    tangents: Option<Bytes>,
+    uvcoords: Option<Bytes>,
+    bitangents: Option<Bytes>,
+}
+
+// Values handed out by the SubMesh getters that are worth building only once.
+#[derive(Default)]
+struct SubMeshCache {
+    texture_name: GILOnceCell<Py<PyString>>,
+}
+
+impl Clone for SubMeshCache {
+    // A cloned SubMesh is a new Python object and interns its own name.
+    fn clone(&self) -> Self {
+        SubMeshCache::default()
+    }
+}
+
+impl fmt::Debug for SubMeshCache {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("SubMeshCache").finish_non_exhaustive()
+    }
+}
+
+// Frozen so the attribute Vecs can back zero-copy NumPy views while Python holds it
 #[derive(Default, Debug, Serialize, Deserialize, Clone)]
-#[pyclass]
+#[pyclass(frozen)]
 pub struct SubMesh {
     pub texture_name: String,
     pub position_count: usize,
@@ -1127,6 +1242,10 @@ pub struct SubMesh {
     pub bitangents: Vec<[f32; 3]>,
     pub indices_count: usize,
     pub indices: Vec<u32>,
+    #[serde(skip)]
+    raw: RawLayers,
+    #[serde(skip)]
+    cache: SubMeshCache,
 }
 
 #[pymethods]
@@ -1136,103 +1255,165 @@ impl SubMesh {
         SubMesh::default()
     }
 
-    pub fn texture_name(&self) -> &str {
-        &self.texture_name
+    pub fn texture_name<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        // Interned, so submeshes sharing a texture also share one string object
+        self.cache
+            .texture_name
+            .get_or_init(py, || PyString::intern(py, &self.texture_name).unbind())
+            .bind(py)
+            .clone()
     }
 
     pub fn position_count(&self) -> usize {
         self.position_count
     }
 
-    pub fn positions(&self) -> Vec<[f32; 3]> {
-        self.positions.clone()
+    pub fn positions<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        rows_view(slf, &slf.get().positions)
     }
 
     pub fn normal_count(&self) -> usize {
         self.normal_count
     }
 
-    pub fn normals(&self) -> Vec<[f32; 3]> {
-        self.normals.clone()
+    pub fn normals<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        rows_view(slf, &slf.get().normals)
     }
 
     pub fn tangent_count(&self) -> usize {
         self.tangent_count
     }
 
-    pub fn tangents(&self) -> Vec<[f32; 4]> {
-        self.tangents.clone()
+    pub fn tangents<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        rows_view(slf, &slf.get().tangents)
+    }
+
+    pub fn tangents_bytes(&self) -> PyBytes {
+        raw_or_encoded(&self.raw.tangents, self.tangents.as_flattened())
     }
 
     pub fn uvcoord_count(&self) -> usize {
         self.uvcoord_count
     }
 
-    pub fn uvcoords(&self) -> Vec<[f32; 2]> {
-        self.uvcoords.clone()
+    pub fn uvcoords<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        rows_view(slf, &slf.get().uvcoords)
+    }
+
+    pub fn uvcoords_bytes(&self) -> PyBytes {
+        raw_or_encoded(&self.raw.uvcoords, self.uvcoords.as_flattened())
     }
 
     pub fn color32_count(&self) -> usize {
         self.color32_count
     }
 
-    pub fn colors32(&self) -> Vec<u32> {
-        self.colors32.clone()
+    pub fn colors32<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray1<u32>>> {
+        values_view(slf, &slf.get().colors32)
     }
 
     pub fn original_vertex_numbers_count(&self) -> usize {
         self.original_vertex_numbers_count
     }
 
-    pub fn original_vertex_numbers(&self) -> Vec<u32> {
-        self.original_vertex_numbers.clone()
+    pub fn original_vertex_numbers<'py>(
+        slf: &Bound<'py, Self>,
+    ) -> PyResult<Bound<'py, PyArray1<u32>>> {
+        values_view(slf, &slf.get().original_vertex_numbers)
     }
 
     pub fn color128_count(&self) -> usize {
         self.color128_count
     }
 
-    pub fn colors128(&self) -> Vec<[f32; 4]> {
-        self.colors128.clone()
+    pub fn colors128<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        rows_view(slf, &slf.get().colors128)
     }
 
     pub fn bitangent_count(&self) -> usize {
         self.bitangent_count
     }
 
-    pub fn bitangents(&self) -> Vec<[f32; 3]> {
-        self.bitangents.clone()
+    pub fn bitangents<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray2<f32>>> {
+        rows_view(slf, &slf.get().bitangents)
+    }
+
+    pub fn bitangents_bytes(&self) -> PyBytes {
+        raw_or_encoded(&self.raw.bitangents, self.bitangents.as_flattened())
     }
 
     pub fn indices_count(&self) -> usize {
         self.indices_count
     }
 
-    pub fn indices(&self) -> Vec<u32> {
-        self.indices.clone()
+    pub fn indices<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyArray1<u32>>> {
+        values_view(slf, &slf.get().indices)
     }
 }
 
 #[derive(Default, Debug, Serialize, Deserialize, Clone)]
-#[pyclass]
 pub struct Mesh {
     pub submesh_count: usize,
     pub submeshes: Vec<SubMesh>,
 }
 
+// Python view of a Mesh. The submeshes are moved into Python objects once, when the
+// Mesh crosses into Python, so no Rust-side copy of their data is kept alongside.
+#[pyclass(name = "Mesh")]
+pub struct PyMesh {
+    submeshes: Vec<Py<SubMesh>>,
+}
+
 #[pymethods]
-impl Mesh {
+impl PyMesh {
     #[new]
     fn new() -> Self {
-        Mesh::default()
+        PyMesh {
+            submeshes: Vec::new(),
+        }
     }
 
     pub fn submesh_count(&self) -> usize {
-        self.submesh_count
+        self.submeshes.len()
     }
 
-    pub fn submeshes(&self) -> Vec<SubMesh> {
-        self.submeshes.clone()
+    pub fn submeshes(&self, py: Python<'_>) -> Vec<Py<SubMesh>> {
+        self.submeshes
+            .iter()
+            .map(|submesh| submesh.clone_ref(py))
+            .collect()
+    }
+
+    pub fn submesh(&self, py: Python<'_>, index: isize) -> PyResult<Py<SubMesh>> {
+        match normalize_index(index, self.submeshes.len()) {
+            Some(index) => Ok(self.submeshes[index].clone_ref(py)),
+            None => Err(PyErr::new::<PyIndexError, _>(format!(
+                "submesh index {} out of range for {} submeshes",
+                index,
+                self.submeshes.len()
+            ))),
+        }
+    }
+}
+
+// Resolve a Python sequence index, where negative values count from the end
+fn normalize_index(index: isize, len: usize) -> Option<usize> {
+    let resolved = if index < 0 {
+        len.checked_sub(index.unsigned_abs())?
+    } else {
+        index as usize
+    };
+    (resolved < len).then_some(resolved)
+}
+
+impl PyMesh {
+    pub fn from_mesh(py: Python<'_>, mesh: Mesh) -> PyResult<Self> {
+        let submeshes = mesh
+            .submeshes
+            .into_iter()
+            .map(|submesh| Py::new(py, submesh))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(PyMesh { submeshes })
     }
 }
 
@@ -1244,8 +1425,12 @@ impl XACFile {
         Self::load_from_reader(&mut binary_reader)
     }
 
-    pub fn load_from_bytes(mut bytes: Vec<u8>) -> io::Result<Self> {
-        let cursor = Cursor::new(&mut bytes);
+    pub fn load_from_bytes(bytes: Vec<u8>) -> io::Result<Self> {
+        Self::load_from_slice(&bytes)
+    }
+
+    pub fn load_from_slice(bytes: &[u8]) -> io::Result<Self> {
+        let cursor = Cursor::new(bytes);
         let mut binary_reader = BinaryReader::new(cursor);
         Self::load_from_reader(&mut binary_reader)
     }
@@ -2372,6 +2557,8 @@ impl XACFile {
                 bitangents: Vec::new(),
                 indices_count: submesh.num_indices as usize,
                 indices: submesh.indices.clone(),
+                raw: RawLayers::default(),
+                cache: SubMeshCache::default(),
             };
 
             // Process texture name if material_index is valid
@@ -2486,6 +2673,12 @@ impl XACFile {
                     submesh_data.tangents.push([tx, ty, tz, tw]);
                 }
                 submesh_data.tangent_count = submesh_data.tangents.len();
+                submesh_data.raw.tangents = Some(layer_slice(
+                    tangents_data.unwrap(),
+                    vertex_offset,
+                    submesh.num_verts,
+                    16,
+                ));
             }
 
             // Write UVs if data exists
@@ -2513,6 +2706,12 @@ impl XACFile {
                     submesh_data.uvcoords.push([u, v]);
                 }
                 submesh_data.uvcoord_count = submesh_data.uvcoords.len();
+                submesh_data.raw.uvcoords = Some(layer_slice(
+                    uvs_data.unwrap(),
+                    vertex_offset,
+                    submesh.num_verts,
+                    8,
+                ));
             }
 
             // Write Colors32 if data exists
@@ -2635,6 +2834,12 @@ impl XACFile {
                     submesh_data.bitangents.push([bx, by, bz]);
                 }
                 submesh_data.bitangent_count = submesh_data.bitangents.len();
+                submesh_data.raw.bitangents = Some(layer_slice(
+                    bitangents_data.unwrap(),
+                    vertex_offset,
+                    submesh.num_verts,
+                    12,
+                ));
             }
 
             // Add submesh to the list if it has valid data
@@ -2778,6 +2983,8 @@ impl XACFile {
                 bitangents: Vec::new(),
                 indices_count: submesh.num_indices as usize,
                 indices: submesh.indices.clone(),
+                raw: RawLayers::default(),
+                cache: SubMeshCache::default(),
             };
 
             // Process texture name if material_index is valid
@@ -2892,6 +3099,12 @@ impl XACFile {
                     submesh_data.tangents.push([tx, ty, tz, tw]);
                 }
                 submesh_data.tangent_count = submesh_data.tangents.len();
+                submesh_data.raw.tangents = Some(layer_slice(
+                    tangents_data.unwrap(),
+                    vertex_offset,
+                    submesh.num_verts,
+                    16,
+                ));
             }
 
             // Write UVs if data exists
@@ -2919,6 +3132,12 @@ impl XACFile {
                     submesh_data.uvcoords.push([u, v]);
                 }
                 submesh_data.uvcoord_count = submesh_data.uvcoords.len();
+                submesh_data.raw.uvcoords = Some(layer_slice(
+                    uvs_data.unwrap(),
+                    vertex_offset,
+                    submesh.num_verts,
+                    8,
+                ));
             }
 
             // Write Colors32 if data exists
@@ -3041,6 +3260,12 @@ impl XACFile {
                     submesh_data.bitangents.push([bx, by, bz]);
                 }
                 submesh_data.bitangent_count = submesh_data.bitangents.len();
+                submesh_data.raw.bitangents = Some(layer_slice(
+                    bitangents_data.unwrap(),
+                    vertex_offset,
+                    submesh.num_verts,
+                    12,
+                ));
             }
 
             // Add submesh to the list if it has valid data
@@ -3081,25 +3306,174 @@ pub fn extract_xac_data(ipf_path: &str, xac_filename: &str) -> io::Result<Vec<Me
     // Load the IPF file
     let ipf = IPFFile::load_from_reader(&mut reader)?;
 
-    let mut result_mesh: Vec<Mesh> = Vec::new();
-    for file_entry in ipf.file_table() {
-        let filename = file_entry.directory_name();
-
-        // Extract only the filename part (without the directory)
-        let file_name_only = Path::new(&filename)
-            .file_name()
-            .and_then(|f| f.to_str())
-            .unwrap_or("");
+    extract_xac_from_ipf(&ipf, &mut reader, xac_filename)
+}
 
-        // Check if the extracted filename matches the target
-        if file_name_only == xac_filename {
-            let result = file_entry.extract(&mut reader)?;
-            let mut xac_data = XACFile::load_from_bytes(result)?;
+// Extract xac data from an IPF whose file table has already been loaded
+pub fn extract_xac_from_ipf<R: Read + Seek>(
+    ipf: &IPFFile,
+    reader: &mut BinaryReader<R>,
+    xac_filename: &str,
+) -> io::Result<Vec<Mesh>> {
+    // Decompress the target entry into memory and parse the XAC straight from it
+    match ipf.find_file(xac_filename) {
+        Some(file_entry) => {
+            let data = file_entry.extract(reader)?;
+            extract_xac_from_bytes(&data)
+        }
+        None => Ok(Vec::new()),
+    }
+}
+
+// Lay out the submeshes of every mesh as one list per attribute. `submesh_offsets[i]`
+// is the position of mesh i's first submesh in those lists, with a final entry for the total.
+pub fn meshes_to_flat_dict<'py>(py: Python<'py>, meshes: &[Mesh]) -> PyResult<Bound<'py, PyDict>> {
+    let submeshes: Vec<&SubMesh> = meshes.iter().flat_map(|mesh| &mesh.submeshes).collect();
+
+    let mut submesh_offsets = Vec::with_capacity(meshes.len() + 1);
+    let mut offset = 0u32;
+    submesh_offsets.push(offset);
+    for mesh in meshes {
+        offset += mesh.submeshes.len() as u32;
+        submesh_offsets.push(offset);
+    }
+
+    let texture_names: Vec<_> = submeshes
+        .iter()
+        .map(|submesh| PyString::intern(py, &submesh.texture_name))
+        .collect();
+    let positions = submeshes
+        .iter()
+        .map(|submesh| rows_to_pyarray(py, &submesh.positions))
+        .collect::<PyResult<Vec<_>>>()?;
+    let normals = submeshes
+        .iter()
+        .map(|submesh| rows_to_pyarray(py, &submesh.normals))
+        .collect::<PyResult<Vec<_>>>()?;
+    let tangents = submeshes
+        .iter()
+        .map(|submesh| layer_array(py, &submesh.raw.tangents, &submesh.tangents))
+        .collect::<PyResult<Vec<_>>>()?;
+    let uvs = submeshes
+        .iter()
+        .map(|submesh| layer_array(py, &submesh.raw.uvcoords, &submesh.uvcoords))
+        .collect::<PyResult<Vec<_>>>()?;
+    let bitangents = submeshes
+        .iter()
+        .map(|submesh| layer_array(py, &submesh.raw.bitangents, &submesh.bitangents))
+        .collect::<PyResult<Vec<_>>>()?;
+    let indices: Vec<_> = submeshes
+        .iter()
+        .map(|submesh| PyArray1::from_slice(py, &submesh.indices))
+        .collect();
+
+    let flat = PyDict::new(py);
+    flat.set_item("texture_names", texture_names)?;
+    flat.set_item("positions", positions)?;
+    flat.set_item("normals", normals)?;
+    flat.set_item("tangents", tangents)?;
+    flat.set_item("uvs", uvs)?;
+    flat.set_item("bitangents", bitangents)?;
+    flat.set_item("indices", indices)?;
+    flat.set_item("submesh_offsets", PyArray1::from_vec(py, submesh_offsets))?;
+    Ok(flat)
+}
+
+// Parse the meshes of an already decompressed xac entry
+pub fn extract_xac_from_bytes(data: &[u8]) -> io::Result<Vec<Mesh>> {
+    XACFile::load_from_slice(data)?.export_all_meshes_into_struct()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // A layer whose component k of vertex v holds `v * 10 + k`
+    fn layer(
+        attribute: XacAttribute,
+        components: usize,
+        total_verts: usize,
+    ) -> XACVertexAttributeLayer {
+        let values: Vec<f32> = (0..total_verts)
+            .flat_map(|v| (0..components).map(move |k| (v * 10 + k) as f32))
+            .collect();
+        XACVertexAttributeLayer {
+            layer_type_id: attribute as u32,
+            attrib_size_in_bytes: (components * 4) as u32,
+            mesh_data: f32_le_bytes(&values),
+            ..Default::default()
+        }
+    }
 
-            result_mesh = xac_data.export_all_meshes_into_struct()?;
-            break; // Stop after extracting the target file
+    fn sub_mesh(num_verts: u32) -> XACSubMesh {
+        XACSubMesh {
+            num_verts,
+            ..Default::default()
         }
     }
 
-    Ok(result_mesh)
+    fn decode(data: &Option<Bytes>) -> Vec<f32> {
+        data.as_ref()
+            .expect("verbatim layer slice")
+            .chunks_exact(4)
+            .map(|chunk| f32::from_le_bytes(chunk.try_into().unwrap()))
+            .collect()
+    }
+
+    #[test]
+    fn normalize_index_follows_python_sequence_rules() {
+        assert_eq!(normalize_index(0, 3), Some(0));
+        assert_eq!(normalize_index(2, 3), Some(2));
+        assert_eq!(normalize_index(-1, 3), Some(2));
+        assert_eq!(normalize_index(-3, 3), Some(0));
+
+        // Out of range in either direction is what Mesh.submesh raises IndexError for
+        assert_eq!(normalize_index(3, 3), None);
+        assert_eq!(normalize_index(-4, 3), None);
+        assert_eq!(normalize_index(0, 0), None);
+        assert_eq!(normalize_index(isize::MIN, 3), None);
+    }
+
+    #[test]
+    fn verbatim_layer_slices_match_decoded_rows() {
+        let mesh = XACMesh {
+            total_verts: 5,
+            num_sub_meshes: 2,
+            num_layers: 3,
+            vertex_attribute_layer: vec![
+                layer(XacAttribute::AttribTangents, 4, 5),
+                layer(XacAttribute::AttribUvcoords, 2, 5),
+                layer(XacAttribute::AttribBitangents, 3, 5),
+            ],
+            sub_meshes: vec![sub_mesh(2), sub_mesh(3)],
+            ..Default::default()
+        };
+
+        let exported = XACFile::default().export_to_struct(&mesh).unwrap();
+        assert_eq!(exported.submeshes.len(), 2);
+
+        for submesh in &exported.submeshes {
+            assert_eq!(
+                decode(&submesh.raw.tangents),
+                submesh.tangents.as_flattened()
+            );
+            assert_eq!(
+                decode(&submesh.raw.uvcoords),
+                submesh.uvcoords.as_flattened()
+            );
+            assert_eq!(
+                decode(&submesh.raw.bitangents),
+                submesh.bitangents.as_flattened()
+            );
+        }
+
+        // The second submesh starts at vertex 2 of the shared layers
+        let second = &exported.submeshes[1];
+        assert_eq!(
+            second.uvcoords,
+            vec![[20.0, 21.0], [30.0, 31.0], [40.0, 41.0]]
+        );
+        assert_eq!(second.tangents[0], [20.0, 21.0, 22.0, 23.0]);
+        assert_eq!(second.bitangents[2], [40.0, 41.0, 42.0]);
+    }
 }